@@ -26,8 +26,11 @@ from colour.hints import (
     NDArrayFloat,
 )
 from colour.utilities import (
+    CACHE_REGISTRY,
     as_float_array,
     from_range_1,
+    int_digest,
+    is_caching_enabled,
     row_as_diagonal,
     to_domain_1,
     validate_method,
@@ -45,6 +48,10 @@ __all__ = [
     "chromatic_adaptation_VonKries",
 ]
 
+_CACHE_MATRIX_INVERSE_CAT: dict = CACHE_REGISTRY.register_cache(
+    f"{__name__}._CACHE_MATRIX_INVERSE_CAT"
+)
+
 
 def matrix_chromatic_adaptation_VonKries(
     XYZ_w: ArrayLike,
@@ -117,6 +124,13 @@ def matrix_chromatic_adaptation_VonKries(
 
     M = CHROMATIC_ADAPTATION_TRANSFORMS[transform]
 
+    hash_key = int_digest(M.tobytes())
+    if is_caching_enabled() and hash_key in _CACHE_MATRIX_INVERSE_CAT:
+        M_i = _CACHE_MATRIX_INVERSE_CAT[hash_key]
+    else:
+        M_i = np.linalg.inv(M)
+        _CACHE_MATRIX_INVERSE_CAT[hash_key] = M_i
+
     RGB_w = vecmul(M, XYZ_w)
     RGB_wr = vecmul(M, XYZ_wr)
 
@@ -125,7 +139,7 @@ def matrix_chromatic_adaptation_VonKries(
 
     D = row_as_diagonal(D)
 
-    M_CAT = np.matmul(np.linalg.inv(M), D)
+    M_CAT = np.matmul(M_i, D)
     M_CAT = np.matmul(M_CAT, M)
 
     return M_CAT
@@ -596,7 +596,16 @@ def vecmul(m: ArrayLike, v: ArrayLike) -> NDArrayFloat:
            [ 0.1954094...,  0.0620396...,  0.0527952...]])
     """
 
-    return np.matmul(as_float_array(m), as_float_array(v)[..., None]).squeeze(-1)
+    m = as_float_array(m)
+    v = as_float_array(v)
+
+    # A single matrix is applied to all the vectors at once by multiplying
+    # them with its transpose, this is dispatched to *BLAS* instead of
+    # performing one small matrix multiplication per vector.
+    if m.ndim == 2:
+        return np.matmul(v, np.transpose(m))
+
+    return np.matmul(m, v[..., None]).squeeze(-1)
 
 
 def euclidean_distance(a: ArrayLike, b: ArrayLike) -> NDArrayFloat:
@@ -435,6 +435,27 @@ class TestVectorDot:
             atol=TOLERANCE_ABSOLUTE_TESTS,
         )
 
+        np.testing.assert_allclose(
+            vecmul(m[0], v),
+            np.array(
+                [
+                    [0.19540944, 0.06203965, 0.05279523],
+                    [0.19540944, 0.06203965, 0.05279523],
+                    [0.19540944, 0.06203965, 0.05279523],
+                    [0.19540944, 0.06203965, 0.05279523],
+                    [0.19540944, 0.06203965, 0.05279523],
+                    [0.19540944, 0.06203965, 0.05279523],
+                ]
+            ),
+            atol=TOLERANCE_ABSOLUTE_TESTS,
+        )
+
+        np.testing.assert_allclose(
+            vecmul(m[0], v[0]),
+            np.array([0.19540944, 0.06203965, 0.05279523]),
+            atol=TOLERANCE_ABSOLUTE_TESTS,
+        )
+
 
 class TestEuclideanDistance:
     """
@@ -115,12 +115,10 @@ PRIMARIES_ARRI_WIDE_GAMUT_4: NDArrayFloat = np.array(
 )
 """*ARRI Wide Gamut 4* colourspace primaries."""
 
-WHITEPOINT_NAME_ARRI_WIDE_GAMUT_4: str = "D65"
+WHITEPOINT_NAME_ARRI_WIDE_GAMUT_4: str = WHITEPOINT_NAME_ARRI_WIDE_GAMUT_3
 """*ARRI Wide Gamut 4* colourspace whitepoint name."""
 
-CCS_WHITEPOINT_ARRI_WIDE_GAMUT_4: NDArrayFloat = CCS_ILLUMINANTS[
-    "CIE 1931 2 Degree Standard Observer"
-][WHITEPOINT_NAME_ARRI_WIDE_GAMUT_4]
+CCS_WHITEPOINT_ARRI_WIDE_GAMUT_4: NDArrayFloat = CCS_WHITEPOINT_ARRI_WIDE_GAMUT_3
 """*ARRI Wide Gamut 4* colourspace whitepoint chromaticity coordinates."""
 
 MATRIX_ARRI_WIDE_GAMUT_4_TO_XYZ: NDArrayFloat = np.array(
@@ -35,7 +35,15 @@ from colour.hints import (
     Tuple,
 )
 from colour.models import XYZ_to_xy, XYZ_to_xyY, xy_to_XYZ
-from colour.utilities import as_float, as_float_array, ones, tsplit
+from colour.utilities import (
+    CACHE_REGISTRY,
+    as_float,
+    as_float_array,
+    int_digest,
+    is_caching_enabled,
+    ones,
+    tsplit,
+)
 
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2013 Colour Developers"
@@ -81,6 +89,11 @@ def xy_to_z(xy: ArrayLike) -> float:
     return z
 
 
+_CACHE_NORMALISED_PRIMARY_MATRIX: dict = CACHE_REGISTRY.register_cache(
+    f"{__name__}._CACHE_NORMALISED_PRIMARY_MATRIX"
+)
+
+
 def normalised_primary_matrix(
     primaries: ArrayLike, whitepoint: ArrayLike
 ) -> NDArrayFloat:
@@ -115,7 +128,18 @@ def normalised_primary_matrix(
            [  0.0000000...e+00,   0.0000000...e+00,   1.0088251...e+00]])
     """
 
-    primaries = np.reshape(primaries, (3, 2))
+    primaries = np.reshape(as_float_array(primaries), (3, 2))
+    whitepoint = as_float_array(whitepoint)
+
+    hash_key = hash(
+        (
+            int_digest(primaries.tobytes()),
+            int_digest(whitepoint.tobytes()),
+            whitepoint.shape,
+        )
+    )
+    if is_caching_enabled() and hash_key in _CACHE_NORMALISED_PRIMARY_MATRIX:
+        return np.copy(_CACHE_NORMALISED_PRIMARY_MATRIX[hash_key])
 
     z = as_float_array(xy_to_z(primaries))[..., None]
     primaries = np.transpose(np.hstack([primaries, z]))
@@ -127,6 +151,8 @@ def normalised_primary_matrix(
 
     npm = np.dot(primaries, coefficients)
 
+    _CACHE_NORMALISED_PRIMARY_MATRIX[hash_key] = np.copy(npm)
+
     return npm
 
 
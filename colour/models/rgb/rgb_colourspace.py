@@ -328,9 +328,9 @@ class RGB_Colourspace:
         """Setter for the **self.primaries** property."""
 
         attest(
-            isinstance(value, (tuple, list, np.ndarray, np.matrix)),
+            isinstance(value, (tuple, list, np.ndarray)),
             f'"matrix_XYZ_to_RGB" property: "{value!r}" is not a "tuple", '
-            f'"list", "ndarray" or "matrix" instance!',
+            f'"list" or "ndarray" instance!',
         )
 
         value = as_float_array(value)
@@ -365,9 +365,9 @@ class RGB_Colourspace:
         """Setter for the **self.whitepoint** property."""
 
         attest(
-            isinstance(value, (tuple, list, np.ndarray, np.matrix)),
+            isinstance(value, (tuple, list, np.ndarray)),
             f'"matrix_XYZ_to_RGB" property: "{value!r}" is not a "tuple", '
-            f'"list", "ndarray" or "matrix" instance!',
+            f'"list" or "ndarray" instance!',
         )
 
         value = as_float_array(value)
@@ -438,9 +438,9 @@ class RGB_Colourspace:
 
         if value is not None:
             attest(
-                isinstance(value, (tuple, list, np.ndarray, np.matrix)),
+                isinstance(value, (tuple, list, np.ndarray)),
                 f'"matrix_RGB_to_XYZ" property: "{value!r}" is not a "tuple", '
-                f'"list", "ndarray" or "matrix" instance!',
+                f'"list" or "ndarray" instance!',
             )
 
             value = as_float_array(value)
@@ -479,9 +479,9 @@ class RGB_Colourspace:
 
         if value is not None:
             attest(
-                isinstance(value, (tuple, list, np.ndarray, np.matrix)),
+                isinstance(value, (tuple, list, np.ndarray)),
                 f'"matrix_XYZ_to_RGB" property: "{value!r}" is not a "tuple", '
-                f'"list", "ndarray" or "matrix" instance!',
+                f'"list" or "ndarray" instance!',
             )
 
             value = as_float_array(value)
@@ -1041,6 +1041,10 @@ def XYZ_to_RGB(
         matrix_XYZ_to_RGB = colourspace.matrix_XYZ_to_RGB  # pyright: ignore
         cctf_encoding = colourspace.cctf_encoding  # pyright: ignore
 
+    M = matrix_XYZ_to_RGB
+
+    # The *chromatic adaptation* matrix is combined with the transformation
+    # matrix so that the array is only traversed once.
     if chromatic_adaptation_transform is not None:
         M_CAT = matrix_chromatic_adaptation_VonKries(
             xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
@@ -1048,9 +1052,9 @@ def XYZ_to_RGB(
             transform=chromatic_adaptation_transform,
         )
 
-        XYZ = vecmul(M_CAT, XYZ)
+        M = np.matmul(M, M_CAT)
 
-    RGB = vecmul(matrix_XYZ_to_RGB, XYZ)
+    RGB = vecmul(M, XYZ)
 
     if apply_cctf_encoding and cctf_encoding is not None:
         with domain_range_scale("ignore"):
@@ -1179,8 +1183,10 @@ def RGB_to_XYZ(
         with domain_range_scale("ignore"):
             RGB = cctf_decoding(RGB)
 
-    XYZ = vecmul(matrix_RGB_to_XYZ, RGB)
+    M = matrix_RGB_to_XYZ
 
+    # The *chromatic adaptation* matrix is combined with the transformation
+    # matrix so that the array is only traversed once.
     if chromatic_adaptation_transform is not None:
         M_CAT = matrix_chromatic_adaptation_VonKries(
             xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
@@ -1188,7 +1194,9 @@ def RGB_to_XYZ(
             transform=chromatic_adaptation_transform,
         )
 
-        XYZ = vecmul(M_CAT, XYZ)
+        M = np.matmul(M_CAT, M)
+
+    XYZ = vecmul(M, RGB)
 
     return from_range_1(XYZ)
 
@@ -25,10 +25,13 @@ import numpy as np
 
 from colour.hints import ArrayLike, Literal, NDArrayFloat
 from colour.utilities import (
+    CACHE_REGISTRY,
     CanonicalMapping,
     Structure,
     as_float,
+    as_float_array,
     from_range_1,
+    is_caching_enabled,
     to_domain_1,
     validate_method,
 )
@@ -551,6 +554,53 @@ exposure factor for *SUP 3.x* and signal and normalised sensor signal for
 *SUP 2.x*.
 """
 
+_CACHE_COEFFICIENTS_ARRILOGC3: dict = CACHE_REGISTRY.register_cache(
+    f"{__name__}._CACHE_COEFFICIENTS_ARRILOGC3"
+)
+
+
+def _coefficients_ARRILogC3(
+    firmware: Literal["SUP 2.x", "SUP 3.x"] | str,
+    method: Literal["Linear Scene Exposure Factor", "Normalised Sensor Signal"] | str,
+    EI: Literal[160, 200, 250, 320, 400, 500, 640, 800, 1000, 1280, 1600],
+) -> tuple:
+    """
+    Return the *ARRI LogC3* curve conversion coefficients for given firmware,
+    conversion method and exposure index.
+
+    Parameters
+    ----------
+    firmware
+        Alexa firmware version.
+    method
+        Conversion method.
+    EI
+        Exposure Index :math:`EI`.
+
+    Returns
+    -------
+    :class:`tuple`
+        *ARRI LogC3* curve conversion coefficients
+        :math:`(cut, a, b, c, d, e, f, e \\cdot cut + f)`.
+    """
+
+    global _CACHE_COEFFICIENTS_ARRILOGC3  # noqa: PLW0602
+
+    hash_key = (firmware, method, EI)
+    if is_caching_enabled() and hash_key in _CACHE_COEFFICIENTS_ARRILOGC3:
+        return _CACHE_COEFFICIENTS_ARRILOGC3[hash_key]
+
+    firmware = validate_method(firmware, ("SUP 3.x", "SUP 2.x"))
+    method = validate_method(
+        method, ("Linear Scene Exposure Factor", "Normalised Sensor Signal")
+    )
+
+    coefficients = DATA_ALEXA_LOG_C_CURVE_CONVERSION[firmware][method][EI]
+
+    _CACHE_COEFFICIENTS_ARRILOGC3[hash_key] = coefficients
+
+    return coefficients
+
 
 def log_encoding_ARRILogC3(
     x: ArrayLike,
@@ -605,16 +655,18 @@ def log_encoding_ARRILogC3(
     """
 
     x = to_domain_1(x)
-    firmware = validate_method(firmware, ("SUP 3.x", "SUP 2.x"))
-    method = validate_method(
-        method, ("Linear Scene Exposure Factor", "Normalised Sensor Signal")
-    )
 
-    cut, a, b, c, d, e, f, _e_cut_f = DATA_ALEXA_LOG_C_CURVE_CONVERSION[firmware][
-        method
-    ][EI]
+    cut, a, b, c, d, e, f, _e_cut_f = _coefficients_ARRILogC3(firmware, method, EI)
+
+    # The logarithmic segment is evaluated in-place to avoid allocating
+    # intermediate arrays and the linear segment only where it applies.
+    t = as_float_array(a * x + b)
+    np.log10(t, out=t)
+    t *= c
+    t += d
 
-    t = np.where(x > cut, c * np.log10(a * x + b) + d, e * x + f)
+    linear = x <= cut
+    t[linear] = e * x[linear] + f
 
     return as_float(from_range_1(t))
 
@@ -672,15 +724,20 @@ def log_decoding_ARRILogC3(
     """
 
     t = to_domain_1(t)
-    method = validate_method(
-        method, ("Linear Scene Exposure Factor", "Normalised Sensor Signal")
-    )
 
-    cut, a, b, c, d, e, f, _e_cut_f = DATA_ALEXA_LOG_C_CURVE_CONVERSION[firmware][
-        method
-    ][EI]
+    cut, a, b, c, d, e, f, _e_cut_f = _coefficients_ARRILogC3(firmware, method, EI)
+
+    # The exponential segment is evaluated in-place to avoid allocating
+    # intermediate arrays and the linear segment only where it applies.
+    # "10 ** ((t - d) / c)" is computed as "exp((t - d) * ln(10) / c)" which
+    # is cheaper than the equivalent power.
+    x = as_float_array((t - d) * (np.log(10) / c))
+    np.exp(x, out=x)
+    x -= b
+    x /= a
 
-    x = np.where(t > e * cut + f, (10 ** ((t - d) / c) - b) / a, (t - f) / e)
+    linear = t <= e * cut + f
+    x[linear] = (t[linear] - f) / e
 
     return as_float(from_range_1(x))
 